@@ -21,9 +21,50 @@ Supported formats:
 import json
 import os
 import re
+from collections import Counter, defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from pathlib import Path
-from typing import Dict, List, Optional, Set
-from dataclasses import dataclass, asdict
+from typing import Dict, Iterator, List, Optional, Set, Tuple
+from dataclasses import dataclass, is_dataclass
+
+
+try:
+    import orjson
+except ImportError:
+    # Optional: falls back to the stdlib json module
+    orjson = None
+
+try:
+    import ijson
+except ImportError:
+    # Optional: package.json is loaded whole instead of streamed
+    ijson = None
+
+# Manifests at least this large are streamed with ijson; smaller ones parse
+# faster in one load_json call
+STREAM_JSON_THRESHOLD = 1 << 20
+
+
+def load_json(data: bytes):
+    """Parse JSON bytes, using orjson when available."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def json_default(obj):
+    """Serialize dataclasses shallowly, field by field, instead of deep-copying them first."""
+    if is_dataclass(obj):
+        return obj.__dict__
+    return str(obj)
+
+
+def dump_json(obj) -> bytes:
+    """Serialize to indented JSON bytes (dataclasses included), using orjson when available."""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+    return json.dumps(obj, indent=2, default=json_default).encode('utf-8')
 
 
 @dataclass
@@ -33,6 +74,7 @@ class Dependency:
     version: str
     category: str
     description: Optional[str] = None
+    language: Optional[str] = None
 
 
 @dataclass
@@ -73,11 +115,72 @@ TEST_PATTERNS = {
     'playwright', 'selenium', 'testing-library', 'rspec', 'minitest'
 }
 
+UTILITY_PATTERNS = {'util', 'helper', 'lodash', 'underscore'}
+
+# Category precedence: a name matching several groups takes the first
+CATEGORY_PATTERNS = [
+    (FRAMEWORK_PATTERNS, 'framework'),
+    (DATABASE_PATTERNS, 'database'),
+    (AUTH_PATTERNS, 'authentication'),
+    (TEST_PATTERNS, 'testing'),
+    (UTILITY_PATTERNS, 'utilities'),
+]
+
+
+def build_category_matcher():
+    """
+    Generate a classifier with every pattern inlined as a substring test.
+    
+    The pattern sets never change at runtime, so each category compiles to a
+    flat `'react' in name or 'vue' in name or ...` chain instead of an any()
+    generator per call.
+    
+    Returns:
+        Function mapping a lowercased name to its category string
+    """
+    lines = ['def match_category(name_lower):']
+    for patterns, category in CATEGORY_PATTERNS:
+        tests = ' or '.join(f'{pattern!r} in name_lower' for pattern in sorted(patterns))
+        lines.append(f'    if {tests}:')
+        lines.append(f'        return {category!r}')
+    lines.append("    return 'other'")
+    
+    namespace = {}
+    exec('\n'.join(lines), namespace)
+    return namespace['match_category']
+
+
+match_category = build_category_matcher()
+
+# Manifest filename -> package manager
+PACKAGE_FILES = {
+    'package.json': 'npm',
+    'requirements.txt': 'pip',
+    'Pipfile': 'pipenv',
+    'pyproject.toml': 'poetry/pip',
+    'Gemfile': 'bundler',
+    'go.mod': 'go',
+    'Cargo.toml': 'cargo',
+    'composer.json': 'composer'
+}
+
+# Directories never searched for manifests
+EXCLUDED_DIRS = frozenset({
+    'node_modules', 'vendor', '.venv', 'venv', '__pycache__', '.git', 'dist', 'build'
+})
+
+# Requirement specifier: name, optional extras, then optional operator and version
+# (e.g. "django>=4.2", "zope.interface ~= 5.0", "uvicorn[standard]>=0.20")
+_REQ_RE = re.compile(r'([A-Za-z0-9_.-]+)(?:\s*\[[^\]]*\])?\s*(?:([><=!~]+)\s*(\S+))?')
+
 
 def find_package_files(root_dir: str = '.') -> Dict[str, Path]:
     """
     Find all package manager files in the project.
     
+    Root-level manifests take precedence over nested ones, since the
+    top-down walk visits the root first.
+    
     Args:
         root_dir: Root directory to search from
         
@@ -87,44 +190,59 @@ def find_package_files(root_dir: str = '.') -> Dict[str, Path]:
     root = Path(root_dir).resolve()
     package_files = {}
     
-    search_patterns = {
-        'package.json': 'npm',
-        'requirements.txt': 'pip',
-        'Pipfile': 'pipenv',
-        'pyproject.toml': 'poetry/pip',
-        'Gemfile': 'bundler',
-        'go.mod': 'go',
-        'Cargo.toml': 'cargo',
-        'composer.json': 'composer'
-    }
-    
-    for pattern, manager in search_patterns.items():
-        matches = list(root.rglob(pattern))
-        # Exclude node_modules, vendor, etc.
-        matches = [m for m in matches if not any(
-            excluded in m.parts for excluded in ['node_modules', 'vendor', '.venv', 'venv', '__pycache__']
-        )]
-        if matches:
-            package_files[manager] = matches[0]  # Use first found
-    
-    return package_files
+    # Single top-down walk; excluded directories are pruned before descent
+    for dirpath, dirnames, filenames in os.walk(root):
+        dirnames[:] = [d for d in dirnames if d not in EXCLUDED_DIRS]
+        for filename in filenames:
+            manager = PACKAGE_FILES.get(filename)
+            if manager and manager not in package_files:
+                package_files[manager] = Path(dirpath) / filename  # Use first found
+    
+    # Report managers in PACKAGE_FILES order regardless of directory listing order
+    return {m: package_files[m] for m in PACKAGE_FILES.values() if m in package_files}
+
+
+def iter_package_json_deps(file_path: Path) -> Iterator[Tuple[str, str]]:
+    """
+    Yield (name, version spec) pairs from dependencies then devDependencies.
+    
+    With ijson installed, manifests of STREAM_JSON_THRESHOLD bytes or more
+    (workspace roots with big scripts/config sections) are streamed so they
+    are never held in memory whole.
+    
+    Args:
+        file_path: Path to package.json
+    """
+    dep_types = ('dependencies', 'devDependencies')
+    
+    if ijson is None or file_path.stat().st_size < STREAM_JSON_THRESHOLD:
+        data = load_json(file_path.read_bytes())
+        for dep_type in dep_types:
+            yield from data.get(dep_type, {}).items()
+        return
+    
+    found = {dep_type: [] for dep_type in dep_types}
+    with open(file_path, 'rb') as f:
+        for prefix, event, value in ijson.parse(f):
+            if event == 'string' and prefix.startswith(('dependencies.', 'devDependencies.')):
+                dep_type, name = prefix.split('.', 1)
+                found[dep_type].append((name, value))
+    
+    for dep_type in dep_types:
+        yield from found[dep_type]
 
 
 def parse_package_json(file_path: Path) -> List[Dependency]:
     """Parse Node.js package.json file."""
-    with open(file_path, 'r') as f:
-        data = json.load(f)
-    
     dependencies = []
-    for dep_type in ['dependencies', 'devDependencies']:
-        if dep_type in data:
-            for name, version in data[dep_type].items():
-                category = categorize_dependency(name)
-                dependencies.append(Dependency(
-                    name=name,
-                    version=version.lstrip('^~>=<'),
-                    category=category
-                ))
+    for name, version in iter_package_json_deps(file_path):
+        category = categorize_dependency(name)
+        dependencies.append(Dependency(
+            name=name,
+            version=version.lstrip('^~>=<'),
+            category=category,
+            language='JavaScript/TypeScript'
+        ))
     
     return dependencies
 
@@ -140,7 +258,7 @@ def parse_requirements_txt(file_path: Path) -> List[Dependency]:
                 continue
             
             # Parse: package==1.0.0 or package>=1.0.0
-            match = re.match(r'^([a-zA-Z0-9_-]+)([><=!]+)?(.+)?', line)
+            match = _REQ_RE.match(line)
             if match:
                 name = match.group(1)
                 version = match.group(3) if match.group(3) else 'latest'
@@ -148,7 +266,8 @@ def parse_requirements_txt(file_path: Path) -> List[Dependency]:
                 dependencies.append(Dependency(
                     name=name,
                     version=version,
-                    category=category
+                    category=category,
+                    language='Python'
                 ))
     
     return dependencies
@@ -175,22 +294,23 @@ def parse_pyproject_toml(file_path: Path) -> List[Dependency]:
                 continue
             version = version_spec if isinstance(version_spec, str) else 'latest'
             category = categorize_dependency(name)
-            dependencies.append(Dependency(name=name, version=version, category=category))
+            dependencies.append(Dependency(name=name, version=version, category=category, language='Python'))
     
     # PEP 621 format
     if 'project' in data:
         deps_list = data['project'].get('dependencies', [])
         for dep_str in deps_list:
-            match = re.match(r'^([a-zA-Z0-9_-]+)([><=!]+)?(.+)?', dep_str)
+            match = _REQ_RE.match(dep_str.strip())
             if match:
                 name = match.group(1)
                 version = match.group(3) if match.group(3) else 'latest'
                 category = categorize_dependency(name)
-                dependencies.append(Dependency(name=name, version=version, category=category))
+                dependencies.append(Dependency(name=name, version=version, category=category, language='Python'))
     
     return dependencies
 
 
+@lru_cache(maxsize=4096)
 def categorize_dependency(name: str) -> str:
     """
     Categorize a dependency based on its name.
@@ -201,20 +321,17 @@ def categorize_dependency(name: str) -> str:
     Returns:
         Category string
     """
-    name_lower = name.lower()
-    
-    if any(pattern in name_lower for pattern in FRAMEWORK_PATTERNS):
-        return 'framework'
-    elif any(pattern in name_lower for pattern in DATABASE_PATTERNS):
-        return 'database'
-    elif any(pattern in name_lower for pattern in AUTH_PATTERNS):
-        return 'authentication'
-    elif any(pattern in name_lower for pattern in TEST_PATTERNS):
-        return 'testing'
-    elif any(keyword in name_lower for keyword in ['util', 'helper', 'lodash', 'underscore']):
-        return 'utilities'
-    else:
-        return 'other'
+    return match_category(name.lower())
+
+
+# Package manager -> manifest parser
+# TODO: Add parsers for Gemfile, go.mod, Cargo.toml, composer.json
+PARSERS = {
+    'npm': parse_package_json,
+    'pip': parse_requirements_txt,
+    'pipenv': parse_requirements_txt,
+    'poetry/pip': parse_pyproject_toml
+}
 
 
 def analyze_dependencies(root_dir: str = '.') -> DependencyReport:
@@ -229,39 +346,32 @@ def analyze_dependencies(root_dir: str = '.') -> DependencyReport:
     """
     package_files = find_package_files(root_dir)
     
+    # Manifests are independent, so read and parse them concurrently
+    manifests = [(manager, path) for manager, path in package_files.items() if manager in PARSERS]
     all_dependencies = []
     
-    for manager, file_path in package_files.items():
-        if manager == 'npm':
-            all_dependencies.extend(parse_package_json(file_path))
-        elif manager in ['pip', 'pipenv']:
-            all_dependencies.extend(parse_requirements_txt(file_path))
-        elif manager in ['poetry/pip']:
-            all_dependencies.extend(parse_pyproject_toml(file_path))
-        # TODO: Add parsers for Gemfile, go.mod, Cargo.toml, composer.json
-    
-    # Categorize dependencies
-    frameworks = [d for d in all_dependencies if d.category == 'framework']
-    databases = [d for d in all_dependencies if d.category == 'database']
-    authentication = [d for d in all_dependencies if d.category == 'authentication']
-    testing = [d for d in all_dependencies if d.category == 'testing']
-    utilities = [d for d in all_dependencies if d.category == 'utilities']
-    other = [d for d in all_dependencies if d.category == 'other']
-    
-    # Language breakdown (based on package managers found)
-    language_breakdown = {}
-    if 'npm' in package_files:
-        language_breakdown['JavaScript/TypeScript'] = len([d for d in all_dependencies if d in parse_package_json(package_files['npm'])])
-    if any(pm in package_files for pm in ['pip', 'pipenv', 'poetry/pip']):
-        language_breakdown['Python'] = len([d for d in all_dependencies if d.category in ['framework', 'database', 'authentication', 'testing', 'utilities', 'other']])
+    if manifests:
+        with ThreadPoolExecutor(max_workers=min(8, len(manifests))) as executor:
+            futures = [executor.submit(PARSERS[manager], path) for manager, path in manifests]
+            # Collect in submission order so the report is deterministic
+            for future in futures:
+                all_dependencies.extend(future.result())
+    
+    # Categorize dependencies in a single pass
+    by_category = defaultdict(list)
+    for dep in all_dependencies:
+        by_category[dep.category].append(dep)
+    
+    # Language breakdown (based on the manifest each dependency came from)
+    language_breakdown = dict(Counter(d.language for d in all_dependencies))
     
     return DependencyReport(
-        frameworks=frameworks,
-        databases=databases,
-        authentication=authentication,
-        testing=testing,
-        utilities=utilities,
-        other=other,
+        frameworks=by_category['framework'],
+        databases=by_category['database'],
+        authentication=by_category['authentication'],
+        testing=by_category['testing'],
+        utilities=by_category['utilities'],
+        other=by_category['other'],
         language_breakdown=language_breakdown,
         total_dependencies=len(all_dependencies),
         package_managers=list(package_files.keys())
@@ -276,35 +386,38 @@ def generate_markdown_report(report: DependencyReport, output_file: str = '.tmp/
         report: DependencyReport object
         output_file: Output file path
     """
-    os.makedirs(os.path.dirname(output_file), exist_ok=True)
+    parts = []
+    add = parts.append
     
-    with open(output_file, 'w') as f:
-        f.write("# Dependency Analysis Report\n\n")
-        f.write(f"**Total Dependencies**: {report.total_dependencies}\n")
-        f.write(f"**Package Managers**: {', '.join(report.package_managers)}\n\n")
-        
-        f.write("## Language Breakdown\n\n")
-        for lang, count in report.language_breakdown.items():
-            f.write(f"- **{lang}**: {count} packages\n")
-        f.write("\n")
-        
-        sections = [
-            ("Frameworks", report.frameworks),
-            ("Databases", report.databases),
-            ("Authentication", report.authentication),
-            ("Testing", report.testing),
-            ("Utilities", report.utilities),
-            ("Other", report.other)
-        ]
-        
-        for section_name, deps in sections:
-            if deps:
-                f.write(f"## {section_name}\n\n")
-                f.write("| Package | Version |\n")
-                f.write("|---------|----------|\n")
-                for dep in deps:
-                    f.write(f"| {dep.name} | {dep.version} |\n")
-                f.write("\n")
+    add("# Dependency Analysis Report\n\n")
+    add(f"**Total Dependencies**: {report.total_dependencies}\n")
+    add(f"**Package Managers**: {', '.join(report.package_managers)}\n\n")
+    
+    add("## Language Breakdown\n\n")
+    for lang, count in report.language_breakdown.items():
+        add(f"- **{lang}**: {count} packages\n")
+    add("\n")
+    
+    sections = [
+        ("Frameworks", report.frameworks),
+        ("Databases", report.databases),
+        ("Authentication", report.authentication),
+        ("Testing", report.testing),
+        ("Utilities", report.utilities),
+        ("Other", report.other)
+    ]
+    
+    for section_name, deps in sections:
+        if deps:
+            add(f"## {section_name}\n\n")
+            add("| Package | Version |\n")
+            add("|---------|----------|\n")
+            for dep in deps:
+                add(f"| {dep.name} | {dep.version} |\n")
+            add("\n")
+    
+    os.makedirs(os.path.dirname(output_file), exist_ok=True)
+    Path(output_file).write_text(''.join(parts))
     
     print(f"✓ Dependency analysis saved to {output_file}")
 
@@ -323,8 +436,7 @@ def main():
     # Also save JSON for programmatic access
     json_output = '.tmp/project-init/dependency-analysis.json'
     os.makedirs(os.path.dirname(json_output), exist_ok=True)
-    with open(json_output, 'w') as f:
-        json.dump(asdict(report), f, indent=2, default=str)
+    Path(json_output).write_bytes(dump_json(report))
     
     print(f"✓ JSON analysis saved to {json_output}")
     print(f"\nSummary:")
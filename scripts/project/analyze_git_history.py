@@ -13,12 +13,17 @@ Analyzes git repository history to extract:
 Requires: GitPython
 """
 
+import heapq
 import os
+import re
+import sys
 import json
-from datetime import datetime, timedelta
+import time
+from datetime import datetime
+from itertools import chain
 from pathlib import Path
-from typing import Dict, List, Optional
-from dataclasses import dataclass, asdict
+from typing import Dict, Iterator, List, Optional, Tuple
+from dataclasses import dataclass, is_dataclass
 from collections import Counter, defaultdict
 
 try:
@@ -27,6 +32,26 @@ except ImportError:
     print("ERROR: GitPython not installed. Install with: pip install GitPython")
     exit(1)
 
+try:
+    import orjson
+except ImportError:
+    # Optional: falls back to the stdlib json module
+    orjson = None
+
+
+def json_default(obj):
+    """Serialize dataclasses shallowly, field by field, instead of deep-copying them first."""
+    if is_dataclass(obj):
+        return obj.__dict__
+    return str(obj)
+
+
+def dump_json(obj) -> bytes:
+    """Serialize to indented JSON bytes (dataclasses included), using orjson when available."""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+    return json.dumps(obj, indent=2, default=json_default).encode('utf-8')
+
 
 @dataclass
 class ContributorStats:
@@ -55,6 +80,88 @@ class GitAnalysisReport:
     default_branch: str
 
 
+# Conventional commit type prefix, with optional scope: "fix:", "feat(api):".
+# Leading whitespace and case are handled by the pattern, so subjects are
+# matched as-is without a stripped/lowercased copy.
+CONVENTIONAL_COMMIT_RE = re.compile(
+    r'\s*(feat|feature|fix|docs|refactor|test|chore|style)(?:\([^)]*\))?:',
+    re.IGNORECASE
+)
+
+# Unit-separated git log fields. Full history only needs author and time;
+# hashes and messages are read for the recent slice alone. The raw body is
+# used rather than %s, which joins the whole first paragraph onto one line.
+HISTORY_FORMAT = '--pretty=format:%an%x1f%ae%x1f%ct'
+RECENT_FORMAT = '--pretty=format:%H%x1f%an%x1f%ct%x1f%B'
+
+# Commits inspected for message patterns / listed as recent activity
+MESSAGE_SAMPLE_SIZE = 100
+RECENT_ACTIVITY_SIZE = 10
+
+
+def stream_log_lines(repo: Repo, *args: str) -> Iterator[str]:
+    """
+    Stream `git log` output line by line without building GitPython Commit objects.
+    
+    Args:
+        repo: Repository to read
+        *args: Arguments passed to git log
+        
+    Yields:
+        Decoded output lines, newest commit first
+        
+    Raises:
+        GitCommandError: If git log fails (e.g. no commits yet)
+    """
+    proc = repo.git.log(*args, as_process=True)
+    for line in proc.stdout:
+        yield line.decode('utf-8', 'replace').rstrip('\n')
+    proc.wait()
+
+
+def stream_log_records(repo: Repo, *args: str) -> Iterator[str]:
+    """
+    Stream NUL-separated `git log -z` records, for formats spanning several lines.
+    
+    Args:
+        repo: Repository to read
+        *args: Arguments passed to git log
+        
+    Yields:
+        Decoded records, newest commit first
+        
+    Raises:
+        GitCommandError: If git log fails (e.g. no commits yet)
+    """
+    proc = repo.git.log('-z', *args, as_process=True)
+    pending = b''
+    while chunk := proc.stdout.read(1 << 16):
+        records = (pending + chunk).split(b'\0')
+        pending = records.pop()
+        for record in records:
+            yield record.decode('utf-8', 'replace')
+    if pending:
+        yield pending.decode('utf-8', 'replace')
+    proc.wait()
+
+
+def iter_commit_history(repo: Repo, rev: str = 'HEAD') -> Iterator[Tuple[str, str, int]]:
+    """Yield (author_name, author_email, committed_timestamp) for every commit, newest first."""
+    for line in stream_log_lines(repo, HISTORY_FORMAT, rev):
+        author, email, ts = line.split('\x1f', 2)
+        # Few distinct authors across many commits: interned names make the
+        # contributor_stats lookups identity hits and share one string each
+        yield sys.intern(author), sys.intern(email), int(ts)
+
+
+def iter_recent_commits(repo: Repo, count: int, rev: str = 'HEAD') -> Iterator[Tuple[str, str, int, str]]:
+    """Yield (hexsha, author_name, committed_timestamp, subject) for the newest `count` commits."""
+    for record in stream_log_records(repo, RECENT_FORMAT, f'--max-count={count}', rev):
+        hexsha, author, ts, message = record.split('\x1f', 3)
+        # Subject is the first line of the message, as GitPython reported it
+        yield hexsha, author, int(ts), message.strip().split('\n', 1)[0]
+
+
 def analyze_git_repo(repo_path: str = '.') -> GitAnalysisReport:
     """
     Analyze git repository history.
@@ -76,91 +183,84 @@ def analyze_git_repo(repo_path: str = '.') -> GitAnalysisReport:
     if repo.bare:
         raise ValueError("Cannot analyze bare repository")
     
-    # Get all commits
-    commits = list(repo.iter_commits('HEAD'))
+    # Stream full history once (newest first); the newest sets the one-year window
+    history = iter_commit_history(repo)
+    try:
+        newest = next(history, None)
+    except GitCommandError as e:
+        raise ValueError("No commits found in repository") from e
     
-    if not commits:
+    if newest is None:
         raise ValueError("No commits found in repository")
     
-    # Basic stats
-    total_commits = len(commits)
-    first_commit = commits[-1]
-    last_commit = commits[0]
+    last_ts = newest[2]
+    one_year_ago_ts = last_ts - 365 * 86400
     
-    first_date = datetime.fromtimestamp(first_commit.committed_date)
-    last_date = datetime.fromtimestamp(last_commit.committed_date)
-    project_age = (last_date - first_date).days
+    contributor_stats = {}  # author -> [commits, first_ts, last_ts, email]
+    month_counts = defaultdict(int)  # year * 12 + month index -> commits, last year only
+    total_commits = 0
     
-    # Contributor analysis
-    contributor_stats = defaultdict(lambda: {
-        'commits': 0,
-        'first': None,
-        'last': None,
-        'email': None
-    })
-    
-    for commit in commits:
-        author = commit.author.name
-        email = commit.author.email
-        commit_date = datetime.fromtimestamp(commit.committed_date)
-        
-        contributor_stats[author]['commits'] += 1
-        contributor_stats[author]['email'] = email
+    for author, email, committed_ts in chain([newest], history):
+        # Contributor analysis
+        stats = contributor_stats.get(author)
+        if stats is None:
+            contributor_stats[author] = [1, committed_ts, committed_ts, email]
+        else:
+            stats[0] += 1
+            stats[3] = email
+            if committed_ts < stats[1]:
+                stats[1] = committed_ts
+            if committed_ts > stats[2]:
+                stats[2] = committed_ts
         
-        if contributor_stats[author]['first'] is None or commit_date < contributor_stats[author]['first']:
-            contributor_stats[author]['first'] = commit_date
+        # Commit frequency
+        if committed_ts > one_year_ago_ts:
+            local = time.localtime(committed_ts)
+            month_counts[local.tm_year * 12 + local.tm_mon - 1] += 1
         
-        if contributor_stats[author]['last'] is None or commit_date > contributor_stats[author]['last']:
-            contributor_stats[author]['last'] = commit_date
+        total_commits += 1
+        first_ts = committed_ts
     
-    # Top contributors
-    top_contributors = sorted(
-        [
-            ContributorStats(
-                name=name,
-                email=stats['email'],
-                commits=stats['commits'],
-                first_commit=stats['first'].isoformat(),
-                last_commit=stats['last'].isoformat()
-            )
-            for name, stats in contributor_stats.items()
-        ],
-        key=lambda x: x.commits,
-        reverse=True
-    )[:10]  # Top 10
-    
-    # Commit frequency (by month for last year)
-    commit_frequency = defaultdict(int)
-    one_year_ago = last_date - timedelta(days=365)
-    
-    for commit in commits:
-        commit_date = datetime.fromtimestamp(commit.committed_date)
-        if commit_date > one_year_ago:
-            month_key = commit_date.strftime('%Y-%m')
-            commit_frequency[month_key] += 1
-    
-    # Commit message patterns
+    # Message patterns and recent activity only need the newest commits
     message_patterns = Counter()
-    for commit in commits[:100]:  # Analyze last 100 commits
-        message = commit.message.lower().strip()
+    recent_activity = []
+    
+    for i, (hexsha, author, committed_ts, subject) in enumerate(iter_recent_commits(repo, MESSAGE_SAMPLE_SIZE)):
+        match = CONVENTIONAL_COMMIT_RE.match(subject)
+        message_patterns[match.group(1).lower().replace('feature', 'feat') if match else 'other'] += 1
         
-        # Extract conventional commit types
-        if message.startswith('feat:') or message.startswith('feature:'):
-            message_patterns['feat'] += 1
-        elif message.startswith('fix:'):
-            message_patterns['fix'] += 1
-        elif message.startswith('docs:'):
-            message_patterns['docs'] += 1
-        elif message.startswith('refactor:'):
-            message_patterns['refactor'] += 1
-        elif message.startswith('test:'):
-            message_patterns['test'] += 1
-        elif message.startswith('chore:'):
-            message_patterns['chore'] += 1
-        elif message.startswith('style:'):
-            message_patterns['style'] += 1
-        else:
-            message_patterns['other'] += 1
+        if i < RECENT_ACTIVITY_SIZE:
+            recent_activity.append({
+                'hash': hexsha[:8],
+                'author': author,
+                'date': datetime.fromtimestamp(committed_ts).isoformat(),
+                'message': subject.strip()[:80]
+            })
+    
+    # Format month buckets only once, after aggregation
+    commit_frequency = {
+        f"{bucket // 12:04d}-{bucket % 12 + 1:02d}": count
+        for bucket, count in month_counts.items()
+    }
+    
+    # Basic stats
+    first_date = datetime.fromtimestamp(first_ts)
+    last_date = datetime.fromtimestamp(last_ts)
+    project_age = (last_date - first_date).days
+    
+    # Top contributors
+    top_contributors = [
+        ContributorStats(
+            name=name,
+            email=email,
+            commits=commits,
+            first_commit=datetime.fromtimestamp(first_ts).isoformat(),
+            last_commit=datetime.fromtimestamp(last_ts).isoformat()
+        )
+        for name, (commits, first_ts, last_ts, email) in heapq.nlargest(
+            10, contributor_stats.items(), key=lambda item: item[1][0]
+        )
+    ]  # Top 10
     
     # Branching strategy detection
     branches = list(repo.branches)
@@ -169,16 +269,6 @@ def analyze_git_repo(repo_path: str = '.') -> GitAnalysisReport:
     branch_names = [b.name for b in branches]
     branching_strategy = detect_branching_strategy(branch_names)
     
-    # Recent activity (last 10 commits)
-    recent_activity = []
-    for commit in commits[:10]:
-        recent_activity.append({
-            'hash': commit.hexsha[:8],
-            'author': commit.author.name,
-            'date': datetime.fromtimestamp(commit.committed_date).isoformat(),
-            'message': commit.message.strip().split('\n')[0][:80]
-        })
-    
     # Default branch
     try:
         default_branch = repo.active_branch.name
@@ -193,7 +283,7 @@ def analyze_git_repo(repo_path: str = '.') -> GitAnalysisReport:
         total_contributors=len(contributor_stats),
         top_contributors=top_contributors,
         branching_strategy=branching_strategy,
-        commit_frequency=dict(commit_frequency),
+        commit_frequency=commit_frequency,
         commit_message_patterns=dict(message_patterns),
         recent_activity=recent_activity,
         active_branches=active_branches,
@@ -211,14 +301,25 @@ def detect_branching_strategy(branch_names: List[str]) -> str:
     Returns:
         Strategy name (git-flow, feature-branch, trunk-based, other)
     """
-    branch_names_lower = [b.lower() for b in branch_names]
+    branch_names_lower = {b.lower() for b in branch_names}
     
     # Git-flow: develop + master/main + feature/hotfix/release branches
     has_develop = 'develop' in branch_names_lower or 'dev' in branch_names_lower
     has_main = 'main' in branch_names_lower or 'master' in branch_names_lower
-    has_feature_branches = any(b.startswith('feature/') for b in branch_names_lower)
-    has_hotfix = any(b.startswith('hotfix/') for b in branch_names_lower)
-    has_release = any(b.startswith('release/') for b in branch_names_lower)
+    
+    # Single scan for the prefixed branch families, stopping once all are seen
+    has_feature_branches = has_hotfix = has_release = False
+    for b in branch_names_lower:
+        if b.startswith('feature/'):
+            has_feature_branches = True
+        elif b.startswith('hotfix/'):
+            has_hotfix = True
+        elif b.startswith('release/'):
+            has_release = True
+        else:
+            continue
+        if has_feature_branches and has_hotfix and has_release:
+            break
     
     if has_develop and has_main and (has_feature_branches or has_hotfix or has_release):
         return 'git-flow'
@@ -242,59 +343,61 @@ def generate_markdown_report(report: GitAnalysisReport, output_file: str = '.tmp
         report: GitAnalysisReport object
         output_file: Output file path
     """
-    os.makedirs(os.path.dirname(output_file), exist_ok=True)
+    parts = []
+    add = parts.append
+    
+    add("# Git History Analysis\n\n")
+    
+    add("## Project Age\n\n")
+    add(f"- **First Commit**: {report.first_commit_date}\n")
+    add(f"- **Last Commit**: {report.last_commit_date}\n")
+    add(f"- **Age**: {report.project_age_days} days (~{report.project_age_days // 365} years)\n")
+    add(f"- **Total Commits**: {report.total_commits}\n")
+    add(f"- **Default Branch**: `{report.default_branch}`\n\n")
+    
+    add("## Branching Strategy\n\n")
+    add(f"**Detected Strategy**: {report.branching_strategy}\n\n")
+    add(f"- **Active Branches**: {report.active_branches}\n\n")
+    
+    add("## Contributors\n\n")
+    add(f"**Total Contributors**: {report.total_contributors}\n\n")
+    add("### Top Contributors\n\n")
+    add("| Name | Commits | First Commit | Last Commit |\n")
+    add("|------|---------|--------------|-------------|\n")
+    for contrib in report.top_contributors[:5]:
+        add(f"| {contrib.name} | {contrib.commits} | {contrib.first_commit[:10]} | {contrib.last_commit[:10]} |\n")
+    add("\n")
+    
+    add("## Commit Message Patterns\n\n")
+    add("Analysis of last 100 commits:\n\n")
+    for pattern, count in sorted(report.commit_message_patterns.items(), key=lambda x: x[1], reverse=True):
+        add(f"- **{pattern}**: {count} commits\n")
+    add("\n")
+    
+    add("## Recent Activity\n\n")
+    add("Last 10 commits:\n\n")
+    for commit in report.recent_activity:
+        add(f"- `{commit['hash']}` - {commit['author']} ({commit['date'][:10]}): {commit['message']}\n")
+    add("\n")
+    
+    add("## Commit Frequency (Last Year)\n\n")
+    if report.commit_frequency:
+        add("| Month | Commits |\n")
+        add("|-------|----------|\n")
+        for month in sorted(report.commit_frequency.keys(), reverse=True)[:12]:
+            add(f"| {month} | {report.commit_frequency[month]} |\n")
+    else:
+        add("No recent commits in last year.\n")
+    add("\n")
     
-    with open(output_file, 'w') as f:
-        f.write("# Git History Analysis\n\n")
-        
-        f.write("## Project Age\n\n")
-        f.write(f"- **First Commit**: {report.first_commit_date}\n")
-        f.write(f"- **Last Commit**: {report.last_commit_date}\n")
-        f.write(f"- **Age**: {report.project_age_days} days (~{report.project_age_days // 365} years)\n")
-        f.write(f"- **Total Commits**: {report.total_commits}\n")
-        f.write(f"- **Default Branch**: `{report.default_branch}`\n\n")
-        
-        f.write("## Branching Strategy\n\n")
-        f.write(f"**Detected Strategy**: {report.branching_strategy}\n\n")
-        f.write(f"- **Active Branches**: {report.active_branches}\n\n")
-        
-        f.write("## Contributors\n\n")
-        f.write(f"**Total Contributors**: {report.total_contributors}\n\n")
-        f.write("### Top Contributors\n\n")
-        f.write("| Name | Commits | First Commit | Last Commit |\n")
-        f.write("|------|---------|--------------|-------------|\n")
-        for contrib in report.top_contributors[:5]:
-            f.write(f"| {contrib.name} | {contrib.commits} | {contrib.first_commit[:10]} | {contrib.last_commit[:10]} |\n")
-        f.write("\n")
-        
-        f.write("## Commit Message Patterns\n\n")
-        f.write("Analysis of last 100 commits:\n\n")
-        for pattern, count in sorted(report.commit_message_patterns.items(), key=lambda x: x[1], reverse=True):
-            f.write(f"- **{pattern}**: {count} commits\n")
-        f.write("\n")
-        
-        f.write("## Recent Activity\n\n")
-        f.write("Last 10 commits:\n\n")
-        for commit in report.recent_activity:
-            f.write(f"- `{commit['hash']}` - {commit['author']} ({commit['date'][:10]}): {commit['message']}\n")
-        f.write("\n")
-        
-        f.write("## Commit Frequency (Last Year)\n\n")
-        if report.commit_frequency:
-            f.write("| Month | Commits |\n")
-            f.write("|-------|----------|\n")
-            for month in sorted(report.commit_frequency.keys(), reverse=True)[:12]:
-                f.write(f"| {month} | {report.commit_frequency[month]} |\n")
-        else:
-            f.write("No recent commits in last year.\n")
-        f.write("\n")
+    os.makedirs(os.path.dirname(output_file), exist_ok=True)
+    Path(output_file).write_text(''.join(parts))
     
     print(f"✓ Git analysis saved to {output_file}")
 
 
 def main():
     """Main entry point."""
-    import sys
     repo_path = sys.argv[1] if len(sys.argv) > 1 else '.'
     
     print(f"Analyzing git repository: {repo_path}")
@@ -311,8 +414,7 @@ def main():
     # Save JSON
     json_output = '.tmp/project-init/git-analysis.json'
     os.makedirs(os.path.dirname(json_output), exist_ok=True)
-    with open(json_output, 'w') as f:
-        json.dump(asdict(report), f, indent=2, default=str)
+    Path(json_output).write_bytes(dump_json(report))
     
     print(f"✓ JSON analysis saved to {json_output}")
     print(f"\nSummary:")
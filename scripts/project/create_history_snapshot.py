@@ -11,16 +11,18 @@ Usage:
 """
 
 import os
-import shutil
+import re
 import json
-from datetime import datetime
+import shutil
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date, datetime
 from pathlib import Path
 from typing import Dict, List, Optional
 from dataclasses import dataclass
 import argparse
 
 try:
-    from git import Repo
+    from git import Repo, GitCommandError
 except ImportError:
     print("ERROR: GitPython not installed. Install with: pip install GitPython")
     exit(1)
@@ -34,7 +36,59 @@ class TaskInfo:
     file_path: Path
     status: str
     completion_date: Optional[str]
+    str_path: str  # str(file_path), computed once
+    name: str  # file_path.name, computed once
+    
+
+_STATUS_RE = re.compile(r'\*\*Status\*\*:([^\n]*)')
+_SESSION_LINE_RE = re.compile(r'### Session:([^\n]*)')
+_DATE_RE = re.compile(r'\d{4}-\d{2}-\d{2}')
+
+
+def find_task_files(directory: Path, recursive: bool = True) -> List[Path]:
+    """
+    Find task-*.md files with os.scandir (no glob/fnmatch translation).
     
+    Args:
+        directory: Directory to search
+        recursive: Also search subdirectories
+        
+    Returns:
+        List of task file Paths
+    """
+    task_files = []
+    stack = [str(directory)]
+    
+    while stack:
+        with os.scandir(stack.pop()) as entries:
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    if recursive:
+                        stack.append(entry.path)
+                elif entry.name.startswith('task-') and entry.name.endswith('.md'):
+                    task_files.append(Path(entry.path))
+    
+    return task_files
+
+
+def find_subdirectory(parent: Path, prefix: str) -> Optional[Path]:
+    """
+    Find the first subdirectory whose name starts with prefix.
+    
+    Args:
+        parent: Directory to search
+        prefix: Name prefix (e.g., 'epic-003')
+        
+    Returns:
+        Path of the matching directory, or None
+    """
+    # DirEntry carries the file type, so only symlinks need a stat()
+    with os.scandir(parent) as entries:
+        return next(
+            (Path(e.path) for e in entries if e.is_dir() and e.name.startswith(prefix)),
+            None
+        )
+
 
 def parse_task_file(task_file: Path) -> TaskInfo:
     """
@@ -46,39 +100,37 @@ def parse_task_file(task_file: Path) -> TaskInfo:
     Returns:
         TaskInfo object
     """
-    content = task_file.read_text()
+    # One raw read; decoding leniently keeps a stray byte from aborting the snapshot.
+    # The whole file is needed: RPI Sessions sits at the bottom of the template.
+    content = task_file.read_bytes().decode('utf-8', 'replace')
     
     # Extract task ID from filename (task-001-name.md)
     task_id = task_file.stem.split('-')[1]
     task_name = '-'.join(task_file.stem.split('-')[2:])
     
-    # Extract status
-    status_match = content.find('**Status**:')
+    # Extract status (first **Status** line, in the task header)
     status = 'unknown'
-    if status_match >= 0:
-        status_line = content[status_match:content.find('\n', status_match)]
-        if 'completed' in status_line.lower():
+    status_match = _STATUS_RE.search(content)
+    if status_match:
+        status_line = status_match.group(1).lower()
+        if 'completed' in status_line:
             status = 'completed'
-        elif 'in_progress' in status_line.lower():
+        elif 'in_progress' in status_line:
             status = 'in_progress'
         else:
             status = 'pending'
     
     # Try to find completion date from RPI Sessions
     completion_date = None
-    if '## RPI Sessions' in content:
-        sessions_start = content.find('## RPI Sessions')
-        sessions_section = content[sessions_start:sessions_start+1000]
+    sessions_start = content.find('## RPI Sessions')
+    if sessions_start >= 0:
+        sessions_end = sessions_start + 1000
         
-        # Look for completed status
-        if 'Status**: completed' in sessions_section:
-            # Find the date for this session
-            date_start = sessions_section.find('### Session:')
-            if date_start >= 0:
-                date_line = sessions_section[date_start:sessions_section.find('\n', date_start)]
-                # Extract YYYY-MM-DD
-                import re
-                date_match = re.search(r'\d{4}-\d{2}-\d{2}', date_line)
+        # Look for completed status, then take the date of the first session
+        if content.find('Status**: completed', sessions_start, sessions_end) >= 0:
+            session_match = _SESSION_LINE_RE.search(content, sessions_start, sessions_end)
+            if session_match:
+                date_match = _DATE_RE.search(session_match.group(1))
                 if date_match:
                     completion_date = date_match.group(0)
     
@@ -87,41 +139,51 @@ def parse_task_file(task_file: Path) -> TaskInfo:
         task_name=task_name,
         file_path=task_file,
         status=status,
-        completion_date=completion_date
+        completion_date=completion_date,
+        str_path=str(task_file),
+        name=task_file.name
     )
 
 
-def get_git_metrics(repo_path: str, task_files: List[Path]) -> Dict:
+def get_git_metrics(repo_path: str, tasks: List[TaskInfo]) -> Dict:
     """
     Get git metrics for snapshot period.
     
     Args:
         repo_path: Path to git repository
-        task_files: List of task files to analyze
+        tasks: List of TaskInfo objects whose files to analyze
         
     Returns:
         Dictionary with git metrics
     """
     repo = Repo(repo_path)
     
-    # Get all commits that modified task-related files
-    commits = set()
+    # Get all commits that modified task-related files with a single git log:
+    # each record is "\0<hash>" followed by every file that commit changed
+    # (--full-diff lists all of them, not just the task files matched).
+    # A commit is listed once however many task files it touches, so each
+    # commit's file list is computed exactly once.
+    commits = {}  # Insertion-ordered set, newest first
     files_changed = set()
     
-    for task_file in task_files:
-        try:
-            # Get commits that touched this task file
-            task_commits = list(repo.iter_commits(paths=str(task_file), max_count=50))
-            for commit in task_commits:
-                commits.add(commit.hexsha)
-                files_changed.update([item.a_path for item in commit.diff(commit.parents[0] if commit.parents else None)])
-        except:
-            pass  # Task file might not be committed yet
+    try:
+        raw = repo.git.log(
+            '--name-only', '--full-diff', '--pretty=format:%x00%H',
+            '--', *(os.path.abspath(t.str_path) for t in tasks)
+        )
+    except GitCommandError:
+        raw = ''  # e.g. no commits yet
+    
+    for line in raw.splitlines():
+        if line.startswith('\0'):
+            commits[line[1:]] = None
+        elif line:
+            files_changed.add(line)
     
     return {
         'total_commits': len(commits),
         'files_modified': len(files_changed),
-        'commit_hashes': list(commits)[:10]  # First 10
+        'commit_hashes': list(commits)[:10]  # Most recent 10
     }
 
 
@@ -140,14 +202,13 @@ def calculate_duration(tasks: List[TaskInfo]) -> Optional[Dict]:
     if not dates:
         return None
     
-    dates.sort()
-    start_date = dates[0]
-    end_date = dates[-1]
+    # ISO dates order the same as strings, so only the endpoints get parsed
+    start_date = min(dates)
+    end_date = max(dates)
     
     # Calculate duration
-    from datetime import datetime
-    start = datetime.strptime(start_date, '%Y-%m-%d')
-    end = datetime.strptime(end_date, '%Y-%m-%d')
+    start = date.fromisoformat(start_date)
+    end = date.fromisoformat(end_date)
     duration = (end - start).days + 1
     
     return {
@@ -171,81 +232,85 @@ def create_summary(epic_id: str, phase_id: Optional[str], tasks: List[TaskInfo],
     Returns:
         Markdown summary content
     """
-    completed_tasks = [t for t in tasks if t.status == 'completed']
+    # Partition in one pass
+    completed_tasks, other_tasks = [], []
+    for t in tasks:
+        (completed_tasks if t.status == 'completed' else other_tasks).append(t)
+    total = len(tasks)
+    percent_complete = int(len(completed_tasks) / total * 100) if total else 0
     
-    summary = f"""# History Snapshot: {epic_id}"""
+    out = [f"""# History Snapshot: {epic_id}"""]
     
     if phase_id:
-        summary += f" - {phase_id}\n"
+        out.append(f" - {phase_id}\n")
     else:
-        summary += "\n"
+        out.append("\n")
     
-    summary += f"""
+    out.append(f"""
 Created: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}
 
 ## Overview
 
-This snapshot captures the completion of {epic_id}"""
+This snapshot captures the completion of {epic_id}""")
     
     if phase_id:
-        summary += f" {phase_id}"
+        out.append(f" {phase_id}")
     
-    summary += f""".
+    out.append(f""".
 
 ## Metrics
 
-- **Total Tasks**: {len(tasks)}
-- **Completed Tasks**: {len(completed_tasks)} ({int(len(completed_tasks)/len(tasks)*100)}%)
-- **Pending/In Progress**: {len(tasks) - len(completed_tasks)}
-"""
+- **Total Tasks**: {total}
+- **Completed Tasks**: {len(completed_tasks)} ({percent_complete}%)
+- **Pending/In Progress**: {len(other_tasks)}
+""")
     
     if duration:
-        summary += f"""
+        out.append(f"""
 ## Timeline
 
 - **Start Date**: {duration['start_date']}
 - **End Date**: {duration['end_date']}
 - **Duration**: {duration['duration_days']} days
-"""
+""")
     
-    summary += f"""
+    out.append(f"""
 ## Git Activity
 
 - **Commits**: {git_metrics['total_commits']}
 - **Files Modified**: {git_metrics['files_modified']}
 
 ### Recent Commits
-"""
+""")
     
-    for commit_hash in git_metrics['commit_hashes'][:5]:
-        summary += f"- `{commit_hash[:8]}`\n"
+    out.extend(f"- `{commit_hash[:8]}`\n" for commit_hash in git_metrics['commit_hashes'][:5])
     
-    summary += f"""
+    out.append("""
 ## Tasks Completed
 
-"""
+""")
     
-    for task in completed_tasks:
-        completion = f" ({task.completion_date})" if task.completion_date else ""
-        summary += f"- ✅ task-{task.task_id} - {task.task_name}{completion}\n"
+    out.extend(
+        f"- ✅ task-{task.task_id} - {task.task_name}"
+        f"{f' ({task.completion_date})' if task.completion_date else ''}\n"
+        for task in completed_tasks
+    )
     
-    if len(tasks) > len(completed_tasks):
-        summary += f"\n## Tasks Not Completed\n\n"
-        for task in tasks:
-            if task.status != 'completed':
-                status_emoji = '🔄' if task.status == 'in_progress' else '⏳'
-                summary += f"- {status_emoji} task-{task.task_id} - {task.task_name}\n"
+    if other_tasks:
+        out.append("\n## Tasks Not Completed\n\n")
+        for task in other_tasks:
+            status_emoji = '🔄' if task.status == 'in_progress' else '⏳'
+            out.append(f"- {status_emoji} task-{task.task_id} - {task.task_name}\n")
     
-    summary += f"""
+    out.append("""
 ## Files Archived
 
 This snapshot includes copies of all task files at the time of completion:
-"""
+""")
     
-    for task in tasks:
-        summary += f"- {task.file_path.name}\n"
+    out.extend(f"- {task.name}\n" for task in tasks)
     
-    summary += f"""
+    out.append("""
 ## Notes
 
 Add any lessons learned, blockers encountered, or important decisions made during this epic/phase.
@@ -253,9 +318,29 @@ Add any lessons learned, blockers encountered, or important decisions made durin
 ---
 
 *This snapshot was automatically generated by the project-manager agent.*
-"""
+""")
     
-    return summary
+    return ''.join(out)
+
+
+def write_file(path: Path, content: str):
+    """
+    Write text as UTF-8 straight to a file descriptor.
+    
+    Skips the buffered text-IO wrapper; the content is already fully
+    built in memory, so one os.write is all that's needed.
+    
+    Args:
+        path: Destination file
+        content: Text to write
+    """
+    data = memoryview(content.encode('utf-8'))
+    fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+    try:
+        while data:
+            data = data[os.write(fd, data):]
+    finally:
+        os.close(fd)
 
 
 def create_snapshot(project_dir: str, epic_id: str, phase_id: Optional[str] = None, repo_path: str = '.'):
@@ -272,11 +357,7 @@ def create_snapshot(project_dir: str, epic_id: str, phase_id: Optional[str] = No
     epics_dir = project_path / 'planning' / 'epics'
     
     # Find epic directory
-    epic_dir = None
-    for d in epics_dir.iterdir():
-        if d.is_dir() and d.name.startswith(epic_id):
-            epic_dir = d
-            break
+    epic_dir = find_subdirectory(epics_dir, epic_id)
     
     if not epic_dir:
         print(f"ERROR: Epic directory not found for {epic_id}")
@@ -287,20 +368,16 @@ def create_snapshot(project_dir: str, epic_id: str, phase_id: Optional[str] = No
     
     if phase_id:
         # Find phase directory
-        phase_dir = None
-        for d in epic_dir.iterdir():
-            if d.is_dir() and d.name.startswith(phase_id):
-                phase_dir = d
-                break
+        phase_dir = find_subdirectory(epic_dir, phase_id)
         
         if not phase_dir:
             print(f"ERROR: Phase directory not found for {phase_id}")
             return False
         
-        task_files = list(phase_dir.glob('task-*.md'))
+        task_files = find_task_files(phase_dir, recursive=False)
     else:
         # All tasks in epic
-        task_files = list(epic_dir.rglob('task-*.md'))
+        task_files = find_task_files(epic_dir)
     
     if not task_files:
         print(f"ERROR: No task files found")
@@ -308,12 +385,13 @@ def create_snapshot(project_dir: str, epic_id: str, phase_id: Optional[str] = No
     
     print(f"Found {len(task_files)} task files")
     
-    # Parse task files
-    tasks = [parse_task_file(f) for f in task_files]
+    # Parse task files; map() keeps the results in task_files order
+    with ThreadPoolExecutor(max_workers=min(32, len(task_files))) as executor:
+        tasks = list(executor.map(parse_task_file, task_files))
     
     # Get git metrics
     print("Analyzing git history...")
-    git_metrics = get_git_metrics(repo_path, task_files)
+    git_metrics = get_git_metrics(repo_path, tasks)
     
     # Calculate duration
     duration = calculate_duration(tasks)
@@ -330,15 +408,13 @@ def create_snapshot(project_dir: str, epic_id: str, phase_id: Optional[str] = No
     print(f"Creating snapshot: {snapshot_dir}")
     
     # Copy task files
-    for task_file in task_files:
-        dest_file = snapshot_dir / task_file.name
-        shutil.copy2(task_file, dest_file)
-        print(f"  Copied: {task_file.name}")
+    for task in tasks:
+        shutil.copyfile(task.str_path, os.path.join(snapshot_dir, task.name))
+        print(f"  Copied: {task.name}")
     
     # Create summary
     summary = create_summary(epic_id, phase_id, tasks, git_metrics, duration)
-    summary_file = snapshot_dir / 'SUMMARY.md'
-    summary_file.write_text(summary)
+    write_file(snapshot_dir / 'SUMMARY.md', summary)
     print(f"  Created: SUMMARY.md")
     
     # Create metadata JSON
@@ -351,8 +427,7 @@ def create_snapshot(project_dir: str, epic_id: str, phase_id: Optional[str] = No
         'duration': duration,
         'git_metrics': git_metrics
     }
-    metadata_file = snapshot_dir / 'metadata.json'
-    metadata_file.write_text(json.dumps(metadata, indent=2))
+    write_file(snapshot_dir / 'metadata.json', json.dumps(metadata, indent=2))
     print(f"  Created: metadata.json")
     
     print(f"\n✓ Snapshot created successfully: {snapshot_dir}")
@@ -13,6 +13,8 @@ Generates:
 - Mermaid ERD diagram (calls generate_erd.py)
 """
 
+import ast
+import mmap
 import os
 import re
 import json
@@ -52,6 +54,29 @@ class SchemaReport:
     orm_framework: Optional[str] = None
 
 
+# Bytes patterns so the schema can be scanned straight out of an mmap
+_PRISMA_MODEL_RE = re.compile(rb'model\s+(\w+)\s*\{([^}]+)\}')
+# One field per line: name, type, optional marker, trailing attributes
+_PRISMA_FIELD_RE = re.compile(rb'^[ \t]*(\w+)[ \t]+(\w+)(\?)?[ \t]*(.*)$', re.MULTILINE)
+# Field attribute names (@id, @unique, @relation, ...)
+_PRISMA_ATTR_RE = re.compile(rb'@\w+')
+
+# Directories never searched for schema files
+SKIPPED_DIRS = frozenset({'.git', 'node_modules', 'venv', '.venv', '__pycache__'})
+
+
+# Django model field class -> schema field type
+DJANGO_FIELD_TYPES = {
+    'CharField': 'string',
+    'TextField': 'text',
+    'IntegerField': 'integer',
+    'BooleanField': 'boolean',
+    'DateTimeField': 'datetime',
+    'DateField': 'date',
+    'ForeignKey': 'foreign_key',
+}
+
+
 def find_schema_files(root_dir: str = '.') -> Dict[str, List[Path]]:
     """
     Find schema-related files in project.
@@ -62,7 +87,8 @@ def find_schema_files(root_dir: str = '.') -> Dict[str, List[Path]]:
     Returns:
         Dictionary mapping file type to list of Paths
     """
-    root = Path(root_dir).resolve()
+    # abspath is enough to anchor the walk; resolve() would readlink every component
+    root = Path(os.path.abspath(root_dir))
     schema_files = {
         'django_models': [],
         'sqlalchemy_models': [],
@@ -72,40 +98,64 @@ def find_schema_files(root_dir: str = '.') -> Dict[str, List[Path]]:
         'sql_schema': []
     }
     
-    # Django models (models.py)
-    for models_file in root.rglob('models.py'):
-        if 'migrations' not in models_file.parts and 'venv' not in models_file.parts:
-            schema_files['django_models'].append(models_file)
-    
-    # SQLAlchemy models (often models.py or database.py)
-    # TODO: Better detection
-    
-    # Prisma schema
-    for prisma_file in root.rglob('schema.prisma'):
-        schema_files['prisma_schema'].append(prisma_file)
+    # Single scandir walk; DirEntry type info avoids extra stat() calls.
+    # Stack items: (directory, inside a migrations directory)
+    stack = [(str(root), False)]
+    while stack:
+        dir_path, in_migrations = stack.pop()
+        is_migrations_dir = os.path.basename(dir_path) == 'migrations'
+        try:
+            entries = os.scandir(dir_path)
+        except OSError:
+            continue
+        
+        with entries:
+            for entry in entries:
+                name = entry.name
+                if entry.is_dir(follow_symlinks=False):
+                    if name not in SKIPPED_DIRS:
+                        stack.append((entry.path, in_migrations or name == 'migrations'))
+                elif name == 'models.py':
+                    # Django models, skipping copies under migrations/
+                    # TODO: Detect SQLAlchemy models (often models.py or database.py)
+                    if not in_migrations:
+                        schema_files['django_models'].append(Path(entry.path))
+                elif name == 'schema.prisma':
+                    schema_files['prisma_schema'].append(Path(entry.path))
+                elif name == 'schema.sql':
+                    schema_files['sql_schema'].append(Path(entry.path))
+                elif is_migrations_dir and name.endswith(('.js', '.ts')):
+                    # Knex migrations
+                    schema_files['knex_migrations'].append(Path(entry.path))
     
     # Rails migrations
     rails_migrations_dir = root / 'db' / 'migrate'
     if rails_migrations_dir.exists():
         schema_files['rails_migrations'] = list(rails_migrations_dir.glob('*.rb'))
     
-    # Knex migrations
-    for migrations_dir in root.rglob('migrations'):
-        if migrations_dir.is_dir():
-            schema_files['knex_migrations'].extend(migrations_dir.glob('*.js'))
-            schema_files['knex_migrations'].extend(migrations_dir.glob('*.ts'))
-    
-    # SQL schema files
-    for sql_file in root.rglob('schema.sql'):
-        schema_files['sql_schema'].append(sql_file)
+    for paths in schema_files.values():
+        paths.sort()
     
     return {k: v for k, v in schema_files.items() if v}
 
 
+def is_models_attribute(node: ast.AST, attr: str) -> bool:
+    """Check whether an AST node is the attribute reference `models.<attr>`."""
+    return (
+        isinstance(node, ast.Attribute)
+        and node.attr == attr
+        and isinstance(node.value, ast.Name)
+        and node.value.id == 'models'
+    )
+
+
 def parse_django_models(file_path: Path) -> List[Entity]:
     """
     Parse Django models.py file.
     
+    Uses the Python AST, so multi-line field definitions, nested parentheses
+    and strings containing '=' are handled exactly.
+    
     Args:
         file_path: Path to models.py
         
@@ -114,47 +164,64 @@ def parse_django_models(file_path: Path) -> List[Entity]:
     """
     entities = []
     
-    with open(file_path, 'r') as f:
+    with open(file_path, 'rb') as f:
         content = f.read()
     
-    # Find all class definitions that inherit from models.Model
-    class_pattern = r'class\s+(\w+)\(.*models\.Model.*\):\s*\n((?:\s{4}.*\n)*)'
+    try:
+        tree = ast.parse(content, filename=str(file_path))
+    except (SyntaxError, ValueError):
+        return entities
     
-    for match in re.finditer(class_pattern, content):
-        class_name = match.group(1)
-        class_body = match.group(2)
-        
-        # Extract table name if specified
-        meta_match = re.search(r'class\s+Meta:.*db_table\s*=\s*[\'"](\w+)[\'"]', class_body)
-        table_name = meta_match.group(1) if meta_match else class_name.lower() + 's'
-        
-        entity = Entity(name=class_name, table_name=table_name)
+    # Find all class definitions that inherit from models.Model
+    for node in ast.walk(tree):
+        if not isinstance(node, ast.ClassDef):
+            continue
+        if not any(is_models_attribute(base, 'Model') for base in node.bases):
+            continue
         
-        # Extract fields
-        field_patterns = [
-            (r'(\w+)\s*=\s*models\.CharField', 'string'),
-            (r'(\w+)\s*=\s*models\.TextField', 'text'),
-            (r'(\w+)\s*=\s*models\.IntegerField', 'integer'),
-            (r'(\w+)\s*=\s*models\.BooleanField', 'boolean'),
-            (r'(\w+)\s*=\s*models\.DateTimeField', 'datetime'),
-            (r'(\w+)\s*=\s*models\.DateField', 'date'),
-            (r'(\w+)\s*=\s*models\.ForeignKey', 'foreign_key'),
-        ]
+        entity = Entity(name=node.name, table_name=node.name.lower() + 's')
         
-        for pattern, field_type in field_patterns:
-            for field_match in re.finditer(pattern, class_body):
-                field_name = field_match.group(1)
-                field_obj = Field(name=field_name, type=field_type)
-                
+        for stmt in node.body:
+            # Extract table name if specified
+            if isinstance(stmt, ast.ClassDef) and stmt.name == 'Meta':
+                for meta_stmt in stmt.body:
+                    if (
+                        isinstance(meta_stmt, ast.Assign)
+                        and any(isinstance(t, ast.Name) and t.id == 'db_table' for t in meta_stmt.targets)
+                        and isinstance(meta_stmt.value, ast.Constant)
+                        and isinstance(meta_stmt.value.value, str)
+                    ):
+                        entity.table_name = meta_stmt.value.value
+                continue
+            
+            # Extract fields: name = models.<FieldClass>(...)
+            if isinstance(stmt, ast.Assign) and len(stmt.targets) == 1:
+                target = stmt.targets[0]
+            elif isinstance(stmt, ast.AnnAssign) and stmt.value is not None:
+                target = stmt.target
+            else:
+                continue
+            
+            call = stmt.value
+            if not isinstance(target, ast.Name) or not isinstance(call, ast.Call):
+                continue
+            field_class = call.func.attr if isinstance(call.func, ast.Attribute) else None
+            if field_class not in DJANGO_FIELD_TYPES or not is_models_attribute(call.func, field_class):
+                continue
+            
+            field_obj = Field(name=target.id, type=DJANGO_FIELD_TYPES[field_class])
+            
+            for keyword in call.keywords:
+                if not isinstance(keyword.value, ast.Constant):
+                    continue
                 # Check for primary key
-                if 'primary_key=True' in field_match.group(0):
+                if keyword.arg == 'primary_key' and keyword.value.value is True:
                     field_obj.primary_key = True
-                
                 # Check for nullable
-                if 'null=False' in field_match.group(0):
+                elif keyword.arg == 'null' and keyword.value.value is False:
                     field_obj.nullable = False
-                
-                entity.fields.append(field_obj)
+            
+            entity.fields.append(field_obj)
         
         entities.append(entity)
     
@@ -173,48 +240,39 @@ def parse_prisma_schema(file_path: Path) -> List[Entity]:
     """
     entities = []
     
-    with open(file_path, 'r') as f:
-        content = f.read()
-    
-    # Find all model definitions
-    model_pattern = r'model\s+(\w+)\s*\{([^}]+)\}'
-    
-    for match in re.finditer(model_pattern, content):
-        model_name = match.group(1)
-        model_body = match.group(2)
-        
-        entity = Entity(name=model_name, table_name=model_name.lower())
-        
-        # Extract fields
-        field_pattern = r'(\w+)\s+(\w+)(\??)\s*(.*)'
-        
-        for line in model_body.strip().split('\n'):
-            line = line.strip()
-            if not line or line.startswith('@@') or line.startswith('//'):
-                continue
-            
-            field_match = re.match(field_pattern, line)
-            if field_match:
-                field_name = field_match.group(1)
-                field_type = field_match.group(2)
-                optional = field_match.group(3) == '?'
-                attributes = field_match.group(4)
+    with open(file_path, 'rb') as f:
+        # mmap refuses zero-length files
+        if os.fstat(f.fileno()).st_size == 0:
+            return entities
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as content:
+            # Find all model definitions
+            for match in _PRISMA_MODEL_RE.finditer(content):
+                model_name = match.group(1).decode()
+                model_body = match.group(2)
                 
-                field_obj = Field(
-                    name=field_name,
-                    type=field_type,
-                    nullable=optional,
-                    primary_key='@id' in attributes,
-                    unique='@unique' in attributes
-                )
+                entity = Entity(name=model_name, table_name=model_name.lower())
                 
-                # Check for relations
-                if '@relation' in attributes:
-                    field_obj.foreign_key = field_type
+                # Extract fields; @@ block attributes and // comments never match
+                for field_match in _PRISMA_FIELD_RE.finditer(model_body):
+                    field_name, field_type, optional, attributes = field_match.groups()
+                    field_type = field_type.decode()
+                    attribute_names = set(_PRISMA_ATTR_RE.findall(attributes))
+                    
+                    field_obj = Field(
+                        name=field_name.decode(),
+                        type=field_type,
+                        nullable=optional is not None,
+                        primary_key=b'@id' in attribute_names,
+                        unique=b'@unique' in attribute_names
+                    )
+                    
+                    # Check for relations
+                    if b'@relation' in attribute_names:
+                        field_obj.foreign_key = field_type
+                    
+                    entity.fields.append(field_obj)
                 
-                entity.fields.append(field_obj)
-        
-        entities.append(entity)
+                entities.append(entity)
     
     return entities
 
@@ -276,38 +334,48 @@ def generate_markdown_report(report: SchemaReport, output_file: str = '.tmp/proj
     """
     os.makedirs(os.path.dirname(output_file), exist_ok=True)
     
-    with open(output_file, 'w') as f:
-        f.write("# Database Schema Extraction\n\n")
-        f.write(f"**ORM Framework**: {report.orm_framework or 'Unknown'}\n")
-        f.write(f"**Total Entities**: {len(report.entities)}\n\n")
+    parts = [
+        "# Database Schema Extraction\n\n",
+        f"**ORM Framework**: {report.orm_framework or 'Unknown'}\n",
+        f"**Total Entities**: {len(report.entities)}\n\n",
+    ]
+    
+    for entity in report.entities:
+        parts.append(
+            f"## {entity.name}\n\n"
+            f"**Table**: `{entity.table_name}`\n\n"
+            "### Fields\n\n"
+            "| Name | Type | Nullable | Constraints |\n"
+            "|------|------|----------|-------------|\n"
+        )
         
-        for entity in report.entities:
-            f.write(f"## {entity.name}\n\n")
-            f.write(f"**Table**: `{entity.table_name}`\n\n")
-            f.write("### Fields\n\n")
-            f.write("| Name | Type | Nullable | Constraints |\n")
-            f.write("|------|------|----------|-------------|\n")
-            
-            for field in entity.fields:
-                constraints = []
-                if field.primary_key:
-                    constraints.append("PRIMARY KEY")
-                if field.unique:
-                    constraints.append("UNIQUE")
-                if field.foreign_key:
-                    constraints.append(f"FK → {field.foreign_key}")
-                
-                f.write(f"| {field.name} | {field.type} | {'Yes' if field.nullable else 'No'} | {', '.join(constraints) or '-'} |\n")
+        for field in entity.fields:
+            constraints = []
+            if field.primary_key:
+                constraints.append("PRIMARY KEY")
+            if field.unique:
+                constraints.append("UNIQUE")
+            if field.foreign_key:
+                constraints.append(f"FK → {field.foreign_key}")
             
-            f.write("\n")
+            parts.append(f"| {field.name} | {field.type} | {'Yes' if field.nullable else 'No'} | {', '.join(constraints) or '-'} |\n")
         
-        if report.relationships:
-            f.write("## Relationships\n\n")
-            f.write("| From | To | Type | Field |\n")
-            f.write("|------|----|----- |-------|\n")
-            for rel in report.relationships:
-                f.write(f"| {rel['from']} | {rel['to']} | {rel['type']} | {rel['field']} |\n")
-            f.write("\n")
+        parts.append("\n")
+    
+    if report.relationships:
+        parts.append(
+            "## Relationships\n\n"
+            "| From | To | Type | Field |\n"
+            "|------|----|----- |-------|\n"
+        )
+        parts.extend(
+            f"| {rel['from']} | {rel['to']} | {rel['type']} | {rel['field']} |\n"
+            for rel in report.relationships
+        )
+        parts.append("\n")
+    
+    with open(output_file, 'w') as f:
+        f.writelines(parts)
     
     print(f"✓ Schema extraction saved to {output_file}")
 
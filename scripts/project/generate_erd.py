@@ -14,6 +14,57 @@ from pathlib import Path
 from typing import Dict, List
 
 
+# Relationship type -> Mermaid syntax (unknown types render as 1:N)
+RELATIONSHIP_SYNTAX = {
+    '1:1': '||--||',
+    '1:N': '||--o{',
+    'N:M': '}o--o{',
+}
+
+# Constraint suffix for every combination of PK=1, FK=2, UK=4, NOT NULL=8
+CONSTRAINT_NAMES = ('PK', 'FK', 'UK', 'NOT NULL')
+CONSTRAINT_STRINGS = tuple(
+    f" \"{', '.join(names)}\"" if names else ""
+    for mask in range(1 << len(CONSTRAINT_NAMES))
+    for names in [[n for i, n in enumerate(CONSTRAINT_NAMES) if mask & (1 << i)]]
+)
+
+
+def format_field(field: Dict) -> str:
+    """
+    Format one field line of an entity block.
+    
+    Args:
+        field: Field dictionary
+        
+    Returns:
+        Mermaid field line
+    """
+    mask = (
+        bool(field.get('primary_key'))
+        | bool(field.get('foreign_key')) << 1
+        | bool(field.get('unique')) << 2
+        | (not field.get('nullable', True)) << 3
+    )
+    return f"        {field['type']} {field['name']}{CONSTRAINT_STRINGS[mask]}"
+
+
+def format_relationship(rel: Dict) -> str:
+    """
+    Format one relationship line.
+    
+    Args:
+        rel: Relationship dictionary
+        
+    Returns:
+        Mermaid relationship line
+    """
+    mermaid_rel = RELATIONSHIP_SYNTAX.get(rel.get('type', '1:N'), '||--o{')
+    field = rel.get('field', '')
+    label = f' : "{field}"' if field else ''
+    return f"    {rel['from']} {mermaid_rel} {rel['to']}{label}"
+
+
 def generate_mermaid_erd(schema_data: Dict) -> str:
     """
     Generate Mermaid ERD from schema data.
@@ -24,58 +75,23 @@ def generate_mermaid_erd(schema_data: Dict) -> str:
     Returns:
         Mermaid ERD syntax string
     """
-    lines = ["erDiagram"]
-    
     entities = schema_data.get('entities', [])
     relationships = schema_data.get('relationships', [])
     
-    # Generate entity definitions
-    for entity in entities:
-        entity_name = entity['name']
-        fields = entity.get('fields', [])
-        
-        if fields:
-            lines.append(f"    {entity_name} {{")
-            for field in fields:
-                field_name = field['name']
-                field_type = field['type']
-                constraints = []
-                
-                if field.get('primary_key'):
-                    constraints.append('PK')
-                if field.get('foreign_key'):
-                    constraints.append('FK')
-                if field.get('unique'):
-                    constraints.append('UK')
-                if not field.get('nullable', True):
-                    constraints.append('NOT NULL')
-                
-                constraint_str = f" \"{', '.join(constraints)}\"" if constraints else ""
-                lines.append(f"        {field_type} {field_name}{constraint_str}")
-            
-            lines.append("    }")
-    
-    # Generate relationships
-    for rel in relationships:
-        from_entity = rel['from']
-        to_entity = rel['to']
-        rel_type = rel.get('type', '1:N')
-        field = rel.get('field', '')
-        
-        # Convert relationship type to Mermaid syntax
-        if rel_type == '1:1':
-            mermaid_rel = '||--||'
-        elif rel_type == '1:N':
-            mermaid_rel = '||--o{'
-        elif rel_type == 'N:M':
-            mermaid_rel = '}o--o{'
-        else:
-            mermaid_rel = '||--o{'
-        
-        label = f' : "{field}"' if field else ''
-        lines.append(f"    {from_entity} {mermaid_rel} {to_entity}{label}")
+    # Entity definitions, one joined block per entity with fields
+    entity_blocks = [
+        "\n".join((
+            f"    {entity['name']} {{",
+            *(format_field(field) for field in entity['fields']),
+            "    }",
+        ))
+        for entity in entities
+        if entity.get('fields')
+    ]
+    
+    relationship_lines = [format_relationship(rel) for rel in relationships]
     
-    return '\n'.join(lines)
+    return "\n".join(["erDiagram", *entity_blocks, *relationship_lines])
 
 
 def load_schema_from_json(json_file: str) -> Dict:
@@ -19,20 +19,17 @@ Updates:
 import os
 import re
 import json
+import mmap
+import shutil
+import subprocess
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
+from itertools import repeat
 from pathlib import Path
-from typing import Dict, List, Optional, Tuple
-from dataclasses import dataclass
+from typing import Dict, Iterator, List, NamedTuple, Optional, Tuple
 
-try:
-    from git import Repo
-except ImportError:
-    print("ERROR: GitPython not installed. Install with: pip install GitPython")
-    exit(1)
 
-
-@dataclass
-class CommitInfo:
+class CommitInfo(NamedTuple):
     """Represents a single commit."""
     hash: str
     message: str
@@ -40,8 +37,7 @@ class CommitInfo:
     date: datetime
     
 
-@dataclass
-class TaskUpdate:
+class TaskUpdate(NamedTuple):
     """Represents a task status update."""
     task_id: str
     epic_id: str
@@ -51,151 +47,309 @@ class TaskUpdate:
     commit_message: str
 
 
-# Moderate sensitivity patterns
-COMPLETION_PATTERNS = [
-    r'feat:\s*complete\s+(.+)',
-    r'feat:\s*finish\s+(.+)',
-    r'complete\s+task[- ](\d+)',
-    r'finish\s+task[- ](\d+)',
-    r'epic\s+complete',
-    r'phase\s+complete',
-    r'milestone',
-]
-
-TASK_REFERENCE_PATTERNS = [
-    r'closes\s+#task[- ](\d+)',
-    r'closes\s+task[- ](\d+)',
-    r'task[- ](\d+)',
-]
-
-
-def get_last_update_time(project_dir: str = '.opencode/project') -> Optional[str]:
+# git log record: hash, author, commit time, raw message (records are NUL-separated with -z)
+COMMIT_FORMAT = '%H%x1f%an%x1f%ct%x1f%B'
+
+# Moderate sensitivity patterns, scanned in one finditer pass: any match
+# without a task group is a completion trigger, and every task group is a
+# referenced task ID. Trigger alternatives stop before (or only look ahead
+# at) the text after them so task references there are still matched.
+_COMMIT_SCAN_RE = re.compile(r'''
+    (?:complete|finish)\s+(?=task[- ]\d)   # complete/finish task-NNN
+    | feat:\s*(?:complete|finish)\s+(?=.)  # feat: complete/finish X
+    | (?:epic|phase)\s+complete
+    | milestone
+    | task[- ](?P<task>\d+)                # task-NNN, closes #task-NNN, ...
+''', re.IGNORECASE | re.VERBOSE)
+
+# Every completion trigger contains one of these, so a message without
+# any of them can skip the regex
+_TRIGGER_LITERALS = ('complete', 'finish', 'milestone')
+
+# Task and epic markdown fields rewritten on update
+_LAST_UPDATED_RE = re.compile(r'(\*\*Last Updated\*\*:\s*)\[.*?\]')
+# Every rewrite update_task_status makes, as one alternation for a single pass
+_TASK_UPDATE_RE = re.compile(
+    r'(?P<status>\*\*Status\*\*:\s*)(?:pending|in_progress)'
+    r'|(?P<updated>\*\*Last Updated\*\*:\s*)\[.*?\]'
+    r'|(?P<sessions>## RPI Sessions)'
+)
+_COMPLETION_RE = re.compile(r'(\*\*Overall Completion\*\*:\s*)\d+%')
+_COUNTS_RE = re.compile(r'(\*\*Completed\*\*:\s*)\d+\s*/\s*\d+')
+# Task files are checked as raw bytes; the exact spelling is tried as a substring first
+_TASK_COMPLETED_RE = re.compile(rb'\*\*Status\*\*:\s*completed')
+_TASK_COMPLETED_EXACT = b'**Status**: completed'
+
+# Task files at least this large are mapped rather than read into memory
+MMAP_THRESHOLD = 64 * 1024
+
+# task-{task_id}-*.md
+_TASK_FILENAME_RE = re.compile(r'task-(\d+)-.*\.md', re.DOTALL)
+
+
+def get_last_update_time(timestamp_file: Path) -> Optional[str]:
     """
     Get timestamp of last project update.
     
     Args:
-        project_dir: Path to project directory
+        timestamp_file: Path to the project's .last_update file
         
     Returns:
         ISO timestamp string or None
     """
-    timestamp_file = Path(project_dir) / '.last_update'
+    if timestamp_file.exists():
+        return timestamp_file.read_text().split('\n')[0].strip()
+    
+    return None
+
+
+def get_last_update_commit(timestamp_file: Path) -> Optional[str]:
+    """
+    Get the HEAD commit recorded at the last project update.
     
+    Args:
+        timestamp_file: Path to the project's .last_update file
+        
+    Returns:
+        Full commit SHA or None (no update yet, or written by an older version)
+    """
     if timestamp_file.exists():
-        return timestamp_file.read_text().strip()
+        lines = timestamp_file.read_text().split('\n')
+        if len(lines) > 1 and lines[1].strip():
+            return lines[1].strip()
     
     return None
 
 
-def save_last_update_time(project_dir: str = '.opencode/project'):
+def save_last_update_time(timestamp_file: Path, run_time: datetime, head_commit: Optional[str] = None):
     """
-    Save current timestamp as last update time.
+    Save the run's timestamp, and HEAD if known, as last update.
     
     Args:
-        project_dir: Path to project directory
+        timestamp_file: Path to the project's .last_update file
+        run_time: Time this update run started
+        head_commit: Full SHA of HEAD to resume from on the next run
     """
-    timestamp_file = Path(project_dir) / '.last_update'
     timestamp_file.parent.mkdir(parents=True, exist_ok=True)
-    timestamp_file.write_text(datetime.now().isoformat())
+    
+    # Line 1: timestamp (time-filter fallback), line 2: commit to resume from
+    content = run_time.isoformat()
+    if head_commit:
+        content += f'\n{head_commit}'
+    timestamp_file.write_text(content)
 
 
-def get_commits_since(repo_path: str = '.', since: Optional[str] = None) -> List[CommitInfo]:
+def load_status_index(index_file: Path) -> Dict[str, List]:
     """
-    Get commits since specified time.
+    Load cached task completion states.
     
     Args:
-        repo_path: Path to git repository
-        since: ISO timestamp to get commits since
+        index_file: Path to the project's .status_index.json file
         
     Returns:
-        List of CommitInfo objects
+        Dictionary mapping task file path to [mtime_ns, size, completed]
+    """
+    try:
+        return json.loads(index_file.read_bytes())
+    except (OSError, ValueError):
+        return {}
+
+
+def save_status_index(status_index: Dict[str, List], index_file: Path):
     """
-    repo = Repo(repo_path)
+    Save cached task completion states.
     
-    if since:
-        commits = list(repo.iter_commits(f'--since="{since}"'))
-    else:
-        # Get last 10 commits if no timestamp
-        commits = list(repo.iter_commits(max_count=10))
-    
-    return [
-        CommitInfo(
-            hash=commit.hexsha[:8],
-            message=commit.message.strip(),
-            author=commit.author.name,
-            date=datetime.fromtimestamp(commit.committed_date)
-        )
-        for commit in commits
-    ]
+    Args:
+        status_index: Index as returned by load_status_index
+        index_file: Path to the project's .status_index.json file
+    """
+    index_file.write_text(json.dumps(status_index, separators=(',', ':')))
 
 
-def should_trigger_update(commit: CommitInfo) -> bool:
+def get_head_commit(repo_path: str = '.') -> Optional[str]:
     """
-    Check if commit should trigger project update.
+    Get the full SHA of HEAD.
+    
+    Args:
+        repo_path: Path to git repository
+        
+    Returns:
+        Commit SHA or None if it cannot be resolved
+    """
+    result = subprocess.run(
+        ['git', '-C', repo_path, 'rev-parse', '--verify', '--quiet', 'HEAD'],
+        capture_output=True, encoding='utf-8'
+    )
+    return result.stdout.strip() or None
+
+
+def get_commits_since(repo_path: str = '.', since: Optional[str] = None, since_commit: Optional[str] = None,
+                      until_commit: Optional[str] = None) -> List[CommitInfo]:
+    """
+    Get commits since the last update.
+    
+    Args:
+        repo_path: Path to git repository
+        since: ISO timestamp to get commits since (fallback)
+        since_commit: Commit SHA to get commits after; preferred over since
+        until_commit: Last commit to include; defaults to HEAD
+        
+    Returns:
+        List of CommitInfo objects
+    """
+    # One git log process instead of a GitPython object lookup per commit
+    args = ['git', '-C', repo_path, 'log', '-z', f'--pretty=format:{COMMIT_FORMAT}']
+    
+    if since or since_commit:
+        # Let git drop commits that cannot trigger; scan_commit still does
+        # the exact check. Multiple --grep options are ORed.
+        args += ['--fixed-strings', '--regexp-ignore-case']
+        args += [f'--grep={literal}' for literal in _TRIGGER_LITERALS]
+    
+    until = until_commit or 'HEAD'
+    
+    output = None
+    if since_commit:
+        # A topological range is exact and immune to clock skew
+        result = subprocess.run(
+            args + [f'{since_commit}..{until}', '--'],
+            capture_output=True, encoding='utf-8', errors='replace'
+        )
+        if result.returncode == 0:
+            output = result.stdout
+        # else: the commit is gone (e.g. rewritten history); use the time filter
+    
+    if output is None:
+        if since:
+            args.append(f'--since={since}')
+        else:
+            # Get last 10 commits if no timestamp, including when the stored
+            # commit was rejected, rather than rescanning the whole history
+            args.append('--max-count=10')
+        
+        output = subprocess.run(
+            args + [until, '--'], capture_output=True, check=True, encoding='utf-8', errors='replace'
+        ).stdout
+    
+    commits = []
+    for record in output.split('\0'):
+        if not record:
+            continue
+        commit_hash, author, timestamp, message = record.split('\x1f', 3)
+        commits.append(CommitInfo(
+            hash=commit_hash[:8],
+            message=message.strip(),
+            author=author,
+            date=datetime.fromtimestamp(int(timestamp))
+        ))
+    
+    return commits
+
+
+def scan_commit(commit: CommitInfo) -> Optional[List[str]]:
+    """
+    Check if commit should trigger project update and extract its task IDs.
     
     Args:
         commit: CommitInfo object
         
     Returns:
-        True if update should be triggered
+        None if no update should be triggered, otherwise the list of
+        referenced task IDs (e.g., ['001', '002'])
     """
+    # The lowercase copy only feeds the substring prefilter; the regex is
+    # case-insensitive and searches the message as-is
     message_lower = commit.message.lower()
     
-    for pattern in COMPLETION_PATTERNS:
-        if re.search(pattern, message_lower):
-            return True
+    if not any(literal in message_lower for literal in _TRIGGER_LITERALS):
+        return None
+    
+    triggered = False
+    task_ids = set()  # Unique IDs
     
-    return False
+    for match in _COMMIT_SCAN_RE.finditer(commit.message):
+        task_id = match.group('task')
+        if task_id is None:
+            triggered = True
+        else:
+            task_ids.add(task_id)
+    
+    return list(task_ids) if triggered else None
 
 
-def extract_task_references(commit: CommitInfo) -> List[str]:
+def iter_task_files(directory: str) -> Iterator[os.DirEntry]:
     """
-    Extract task IDs from commit message.
+    Yield task-*.md files under a directory, recursively.
+    
+    Uses os.scandir so directory entries come with their file type and no
+    Path object is built per entry.
     
     Args:
-        commit: CommitInfo object
+        directory: Directory to walk
+        
+    Yields:
+        DirEntry for each task file
+    """
+    stack = [directory]
+    
+    while stack:
+        try:
+            entries = os.scandir(stack.pop())
+        except OSError:
+            continue
+        
+        with entries:
+            for entry in entries:
+                name = entry.name
+                if entry.is_dir(follow_symlinks=False):
+                    stack.append(entry.path)
+                elif name.startswith('task-') and name.endswith('.md'):
+                    yield entry
+
+
+def build_task_index(epics_dir: Path) -> Dict[str, Path]:
+    """
+    Map task IDs to task files with a single walk of the epics tree.
+    
+    Args:
+        epics_dir: Path to planning/epics directory
         
     Returns:
-        List of task IDs (e.g., ['001', '002'])
+        Dictionary mapping task number (e.g., '001') to task file Path
     """
-    task_ids = []
+    task_index = {}
     
-    for pattern in TASK_REFERENCE_PATTERNS:
-        matches = re.findall(pattern, commit.message, re.IGNORECASE)
-        task_ids.extend(matches)
+    for entry in iter_task_files(str(epics_dir)):
+        match = _TASK_FILENAME_RE.fullmatch(entry.name)
+        if match:
+            # First file found wins, as the old rglob lookup did
+            task_index.setdefault(match.group(1), Path(entry.path))
     
-    return list(set(task_ids))  # Unique IDs
+    return task_index
 
 
-def find_task_file(task_id: str, project_dir: str = '.opencode/project') -> Optional[Path]:
+def find_task_file(task_id: str, task_index: Dict[str, Path]) -> Optional[Path]:
     """
     Find task file by ID.
     
     Args:
         task_id: Task number (e.g., '001')
-        project_dir: Path to project directory
+        task_index: Index from build_task_index
         
     Returns:
         Path to task file or None
     """
-    planning_dir = Path(project_dir) / 'planning' / 'epics'
-    
-    # Search for task-{task_id}-*.md
-    pattern = f'task-{task_id.zfill(3)}-*.md'
-    
-    for task_file in planning_dir.rglob(pattern):
-        return task_file
-    
-    return None
+    return task_index.get(task_id.zfill(3))
 
 
-def update_task_status(task_file: Path, commit: CommitInfo) -> bool:
+def update_task_status(task_file: Path, commit: CommitInfo, run_date: str) -> bool:
     """
     Update task file with completion status.
     
     Args:
         task_file: Path to task file
         commit: CommitInfo that triggered update
+        run_date: Date of this update run (YYYY-MM-DD) for Last Updated
         
     Returns:
         True if updated successfully
@@ -203,53 +357,89 @@ def update_task_status(task_file: Path, commit: CommitInfo) -> bool:
     if not task_file.exists():
         return False
     
+    # The whole file is rewritten: sessions must stay in the task file (the
+    # snapshot script and agents read them there), new ones go directly under
+    # the header rather than at the end, and the status changes length.
     content = task_file.read_text()
     
-    # Update status field
-    content = re.sub(
-        r'(\*\*Status\*\*:\s*)(pending|in_progress)',
-        r'\1completed',
-        content
-    )
-    
-    # Add RPI session entry
+    summary = commit.message.split('\n')[0]
     session_entry = f"""
 ### Session: {commit.date.strftime('%Y-%m-%d')}
 
 **Status**: completed
 **Commit**: `{commit.hash}`
-**Notes**: {commit.message.split('\n')[0]}
+**Notes**: {summary}
 **Outcome**: Task completed successfully
 
 ---
 """
-    
-    # Find RPI Sessions section and append
-    if '## RPI Sessions' in content:
-        content = content.replace(
-            '## RPI Sessions',
-            f'## RPI Sessions{session_entry}'
-        )
-    else:
+    last_updated = f'[{run_date}]'
+    has_sessions = False
+    
+    def rewrite(match):
+        nonlocal has_sessions
+        kind = match.lastgroup
+        if kind == 'status':
+            # Update status field
+            return f'{match.group(kind)}completed'
+        if kind == 'updated':
+            # Update last updated date
+            return f'{match.group(kind)}{last_updated}'
+        # Add RPI session entry under the section header
+        has_sessions = True
+        return f'## RPI Sessions{session_entry}'
+    
+    content = _TASK_UPDATE_RE.sub(rewrite, content)
+    
+    if not has_sessions:
         content += f'\n## RPI Sessions{session_entry}'
     
-    # Update last updated date
-    content = re.sub(
-        r'(\*\*Last Updated\*\*:\s*)\[.*?\]',
-        f'\\1[{datetime.now().strftime("%Y-%m-%d")}]',
-        content
-    )
-    
     task_file.write_text(content)
     return True
 
 
-def calculate_epic_progress(epic_dir: Path) -> Tuple[int, int]:
+def has_completed_status(data) -> bool:
+    """
+    Search task file bytes (or an mmap) for a completed status line.
+    
+    Args:
+        data: bytes or mmap of the task file
+        
+    Returns:
+        True if a completed status line is present
+    """
+    # Regex only when the exact spelling is absent but spacing might differ
+    return data.find(_TASK_COMPLETED_EXACT) >= 0 or (
+        data.find(b'completed') >= 0 and _TASK_COMPLETED_RE.search(data) is not None
+    )
+
+
+def is_task_completed(path: str) -> bool:
+    """
+    Check whether a task file's status is completed.
+    
+    Args:
+        path: Path to task file
+        
+    Returns:
+        True if the file contains a completed status line
+    """
+    with open(path, 'rb') as f:
+        if os.fstat(f.fileno()).st_size < MMAP_THRESHOLD:
+            return has_completed_status(f.read())
+        # Large files are searched in place; pages are faulted in on demand
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as data:
+            return has_completed_status(data)
+
+
+def calculate_epic_progress(epic_dir: Path, status_index: Optional[Dict[str, List]] = None) -> Tuple[int, int]:
     """
     Calculate epic completion progress.
     
     Args:
         epic_dir: Path to epic directory
+        status_index: Optional cache from load_status_index; only files whose
+            mtime or size changed are re-read, and the cache is updated in place
         
     Returns:
         Tuple of (completed_tasks, total_tasks)
@@ -257,84 +447,90 @@ def calculate_epic_progress(epic_dir: Path) -> Tuple[int, int]:
     completed = 0
     total = 0
     
-    for task_file in epic_dir.rglob('task-*.md'):
+    for entry in iter_task_files(str(epic_dir)):
         total += 1
-        content = task_file.read_text()
         
-        if re.search(r'\*\*Status\*\*:\s*completed', content):
-            completed += 1
+        if status_index is not None:
+            st = entry.stat()
+            cached = status_index.get(entry.path)
+            if cached and cached[0] == st.st_mtime_ns and cached[1] == st.st_size:
+                completed += cached[2]
+                continue
+        
+        is_completed = is_task_completed(entry.path)
+        completed += is_completed
+        
+        if status_index is not None:
+            status_index[entry.path] = [st.st_mtime_ns, st.st_size, is_completed]
     
     return completed, total
 
 
-def update_epic_status(epic_dir: Path):
+def update_epic_status(epic_dir: Path, run_date: str, status_index: Optional[Dict[str, List]] = None):
     """
     Update epic STATUS.md file with current progress.
     
     Args:
         epic_dir: Path to epic directory
+        run_date: Date of this update run (YYYY-MM-DD) for Last Updated
+        status_index: Optional task status cache (see calculate_epic_progress)
     """
     status_file = epic_dir / 'STATUS.md'
     
     if not status_file.exists():
         return
     
-    completed, total = calculate_epic_progress(epic_dir)
+    completed, total = calculate_epic_progress(epic_dir, status_index)
     completion_percent = int((completed / total * 100)) if total > 0 else 0
     
     content = status_file.read_text()
     
-    # Update completion percentage
-    content = re.sub(
-        r'(\*\*Overall Completion\*\*:\s*)\d+%',
-        f'\\1{completion_percent}%',
-        content
-    )
+    # Update completion percentage; \g<1> since a bare \1 followed by
+    # the digits would be read as a higher group number
+    content = _COMPLETION_RE.sub(f'\\g<1>{completion_percent}%', content)
     
     # Update counts
-    content = re.sub(
-        r'(\*\*Completed\*\*:\s*)\d+\s*/\s*\d+',
-        f'\\1{completed} / {total}',
-        content
-    )
+    content = _COUNTS_RE.sub(f'\\g<1>{completed} / {total}', content)
     
     # Update timestamp
-    content = re.sub(
-        r'(\*\*Last Updated\*\*:\s*)\[.*?\]',
-        f'\\1[{datetime.now().strftime("%Y-%m-%d")}]',
-        content
-    )
+    content = _LAST_UPDATED_RE.sub(f'\\g<1>[{run_date}]', content)
     
     status_file.write_text(content)
 
 
-def create_history_snapshot(project_dir: str = '.opencode/project'):
+def create_history_snapshot(planning_dir: Path, epics_dir: Path, history_dir: Path, timestamp: str):
     """
     Create timestamped snapshot of roadmap and epic overviews.
     
     Args:
-        project_dir: Path to project directory
+        planning_dir: Path to planning directory (holds roadmap.md)
+        epics_dir: Path to planning/epics directory
+        history_dir: Path to planning/.history directory
+        timestamp: Snapshot file name prefix (YYYY-MM-DD-HHMMSS)
     """
-    history_dir = Path(project_dir) / 'planning' / '.history'
     history_dir.mkdir(parents=True, exist_ok=True)
     
-    timestamp = datetime.now().strftime('%Y-%m-%d-%H%M%S')
+    # copyfile copies in the kernel (sendfile) where available. Hardlinks are
+    # not an option: the sources are rewritten in place, which would change
+    # the snapshots too.
     
     # Snapshot roadmap
-    roadmap_file = Path(project_dir) / 'planning' / 'roadmap.md'
-    if roadmap_file.exists():
-        snapshot_file = history_dir / f'{timestamp}-roadmap.md'
-        snapshot_file.write_text(roadmap_file.read_text())
+    roadmap_file = planning_dir / 'roadmap.md'
+    try:
+        shutil.copyfile(roadmap_file, history_dir / f'{timestamp}-roadmap.md')
+    except FileNotFoundError:
+        pass
     
     # Snapshot epic overviews
-    epics_dir = Path(project_dir) / 'planning' / 'epics'
     for epic_dir in epics_dir.iterdir():
         if epic_dir.is_dir():
             overview_file = epic_dir / 'overview.md'
-            if overview_file.exists():
-                epic_name = epic_dir.name
-                snapshot_file = history_dir / f'{timestamp}-{epic_name}-overview.md'
-                snapshot_file.write_text(overview_file.read_text())
+            epic_name = epic_dir.name
+            snapshot_file = history_dir / f'{timestamp}-{epic_name}-overview.md'
+            try:
+                shutil.copyfile(overview_file, snapshot_file)
+            except FileNotFoundError:
+                pass
 
 
 def main():
@@ -344,7 +540,20 @@ def main():
     repo_path = sys.argv[1] if len(sys.argv) > 1 else '.'
     project_dir = '.opencode/project'
     
-    if not Path(project_dir).exists():
+    # One timestamp for the whole run, so every file it touches agrees
+    run_time = datetime.now()
+    run_date = run_time.strftime('%Y-%m-%d')
+    run_stamp = run_time.strftime('%Y-%m-%d-%H%M%S')
+    
+    # Base paths, built once and passed down
+    project_path = Path(project_dir)
+    planning_dir = project_path / 'planning'
+    epics_dir = planning_dir / 'epics'
+    history_dir = planning_dir / '.history'
+    timestamp_file = project_path / '.last_update'
+    status_index_file = project_path / '.status_index.json'
+    
+    if not project_path.exists():
         print(f"ERROR: Project directory not found: {project_dir}")
         print("Run /project-init first to initialize project structure")
         return 1
@@ -352,15 +561,21 @@ def main():
     print("Analyzing commits for project updates...")
     
     # Get last update time
-    last_update = get_last_update_time(project_dir)
+    last_update = get_last_update_time(timestamp_file)
+    last_commit = get_last_update_commit(timestamp_file)
+    # Resolved once up front: commits landing during the run stay above the
+    # saved commit and are picked up next time
+    head_commit = get_head_commit(repo_path)
     
     if last_update:
         print(f"Last update: {last_update}")
     else:
         print("No previous update found, analyzing recent commits")
+    if last_commit and head_commit:
+        print(f"Commit range: {last_commit[:8]}..{head_commit[:8]}")
     
     # Get commits
-    commits = get_commits_since(repo_path, last_update)
+    commits = get_commits_since(repo_path, last_update, last_commit, head_commit)
     
     if not commits:
         print("No new commits found")
@@ -370,36 +585,48 @@ def main():
     
     # Analyze commits
     updates_made = False
+    epic_dirs = {}  # Insertion-ordered set of epics with updated tasks
+    task_index = None  # Built on the first trigger
     
     for commit in commits:
-        if should_trigger_update(commit):
+        # Trigger check and task references come from the same scan
+        task_ids = scan_commit(commit)
+        if task_ids is not None:
             print(f"\n✓ Trigger found: {commit.hash} - {commit.message[:60]}")
             
-            # Extract task references
-            task_ids = extract_task_references(commit)
+            if task_ids and task_index is None:
+                task_index = build_task_index(epics_dir)
             
             for task_id in task_ids:
-                task_file = find_task_file(task_id, project_dir)
+                task_file = find_task_file(task_id, task_index)
                 
                 if task_file:
                     print(f"  Updating task-{task_id}: {task_file.name}")
-                    update_task_status(task_file, commit)
+                    update_task_status(task_file, commit, run_date)
                     
-                    # Update parent epic
-                    epic_dir = task_file.parent.parent
-                    update_epic_status(epic_dir)
+                    # Parent epic is recalculated once, after all task updates
+                    epic_dirs[task_file.parent.parent] = None
                     
                     updates_made = True
                 else:
                     print(f"  WARNING: Task file not found for task-{task_id}")
     
+    if epic_dirs:
+        status_index = load_status_index(status_index_file)
+        # Epics are scanned concurrently; each writes only its own task
+        # files' keys in the shared index
+        with ThreadPoolExecutor(max_workers=min(16, len(epic_dirs))) as executor:
+            # list() so an exception in any epic propagates here
+            list(executor.map(update_epic_status, epic_dirs, repeat(run_date), repeat(status_index)))
+        save_status_index(status_index, status_index_file)
+    
     if updates_made:
         # Create history snapshot
         print("\nCreating history snapshot...")
-        create_history_snapshot(project_dir)
+        create_history_snapshot(planning_dir, epics_dir, history_dir, run_stamp)
         
         # Update timestamp
-        save_last_update_time(project_dir)
+        save_last_update_time(timestamp_file, run_time, head_commit)
         
         print(f"\n✓ Project status updated successfully")
     else: